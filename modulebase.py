@@ -12,15 +12,31 @@ class ModuleBase(ABC):
     - phi_labels (list(str)): A list of the keys that are expected in the phi dict.
     - kwarg_Labels (list(str)): A list of the labels that are expected in the keyword argument dict.
 
+    Optional properties:
+    - optional_kwarg_labels (list(str)): Labels that may also appear in the keyword argument dict.
+
     Required methods:
     - get_fn(phis, kwargs): Returns the function that is used by Signal.transform()
 
     Additionally, if a kw is used when registering the module, then a "parse_kw" method is required.
     """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    optional_kwarg_labels = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
 
-        self._spec = f'{self.__class__.__module__}.{self.__class__.__name__}'
+        # spec only depends on the class, so compute it once per class
+        cls._spec = f'{cls.__module__}.{cls.__name__}'
+
+        # built once per class, so the checks on every call don't rebuild sets. Labels
+        # implemented as properties can only be read from an instance, at check time.
+        for labels, label_set in (('phi_labels', '_phi_label_set'), ('kwarg_labels', '_kwarg_label_set'),
+                                  ('optional_kwarg_labels', '_optional_kwarg_label_set')):
+            value = getattr(cls, labels)
+            if isinstance(value, property):
+                setattr(cls, label_set, property(lambda self, labels=labels: _label_set(getattr(self, labels))))
+            else:
+                setattr(cls, label_set, _label_set(value))
 
     def __call__(self, *, phis: dict, kwargs: dict):
         # force keyword arguments
@@ -53,10 +69,30 @@ class ModuleBase(ABC):
 
     def check_phis_kwargs(self, *, phis: dict=None, kwargs: dict=None):
         """Check that all the proper phis and kwargs are passed in"""
-        if not (phis is None and self.phi_labels is None):
-            if (phis is None or self.phi_labels is None) or not set(phis.keys()) == set(self.phi_labels):
+        if phis is None and self._phi_label_set is None and kwargs is None and self._kwarg_label_set is None:
+            return
+
+        if not (phis is None and self._phi_label_set is None):
+            if (phis is None or self._phi_label_set is None) or phis.keys() != self._phi_label_set:
                 raise AttributeError(f'phis not properly specified for module "{repr(self)}".')
 
-        if not (kwargs is None and self.kwarg_labels is None):
-            if (kwargs is None or self.kwarg_labels is None) or not set(kwargs.keys()) == set(self.kwarg_labels):
+        kwarg_labels = self._kwarg_label_set
+        optional_labels = self._optional_kwarg_label_set
+        if optional_labels is None:
+            if not (kwargs is None and kwarg_labels is None):
+                if (kwargs is None or kwarg_labels is None) or kwargs.keys() != kwarg_labels:
+                    raise AttributeError(f'kwargs not properly specified for module "{repr(self)}".')
+        else:
+            # required labels must all be passed, optional ones may be
+            required = kwarg_labels if kwarg_labels is not None else frozenset()
+            passed = kwargs.keys() if kwargs is not None else frozenset()
+            if not required <= passed <= required | optional_labels:
                 raise AttributeError(f'kwargs not properly specified for module "{repr(self)}".')
+
+
+def _label_set(labels):
+    """Frozenset of declared labels, None if not declared."""
+    if labels is None:
+        return None
+
+    return frozenset(labels)
@@ -0,0 +1,43 @@
+import numpy as np
+
+# numba is only imported on first use, so loading the module directory (or modules/fir.py)
+# doesn't pull it in or pay the JIT cost unless offsets are actually applied
+_offset_kernel = None
+
+
+def _offset_coefficients(coefficients, offsets, fs):
+    n_channels, n_taps = coefficients.shape
+    out = np.zeros((n_channels, n_taps))
+
+    for i in range(n_channels):
+        shift = offsets[i] * fs
+        for t in range(n_taps):
+            src = t - shift
+            if src < 0 or src > n_taps - 1:
+                continue
+
+            lo = int(np.floor(src))
+            if lo == n_taps - 1:
+                out[i, t] = coefficients[i, lo]
+            else:
+                frac = src - lo
+                out[i, t] = (1 - frac) * coefficients[i, lo] + frac * coefficients[i, lo + 1]
+
+    return out
+
+
+def offset_coefficients_f64(coefficients, offsets, fs):
+    """Shift each channel's coefficients by `offsets * fs` bins.
+
+    Fractional shifts are linearly interpolated and bins shifted in from outside the
+    window are zero, matching `np.interp(t - shift, t, c, left=0, right=0)` per channel.
+    Compiled with Numba (and cached to disk) on first call.
+    """
+    global _offset_kernel
+
+    if _offset_kernel is None:
+        import numba
+
+        _offset_kernel = numba.njit('f8[:, :](f8[:, :], f8[:], f8)', cache=True)(_offset_coefficients)
+
+    return _offset_kernel(coefficients, offsets, fs)
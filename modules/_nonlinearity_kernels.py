@@ -0,0 +1,21 @@
+import math
+
+# numba is only imported on first use, so loading the module directory doesn't pull it in
+_sigmoid_kernel = None
+
+
+def sigmoid_kernel(signal, base, amplitude, shift, kappa, out):
+    """Fused sigmoid over flat arrays, writes into `out`. Compiled with Numba on first call."""
+    global _sigmoid_kernel
+
+    if _sigmoid_kernel is None:
+        import numba
+
+        @numba.njit(parallel=True, fastmath=True, cache=True)
+        def kernel(signal, base, amplitude, shift, kappa, out):
+            for i in numba.prange(signal.shape[0]):
+                out[i] = base + 0.5 * amplitude * (1 + math.tanh(kappa * (signal[i] - shift)))
+
+        _sigmoid_kernel = kernel
+
+    _sigmoid_kernel(signal, base, amplitude, shift, kappa, out)
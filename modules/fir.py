@@ -1,16 +1,35 @@
+from collections import OrderedDict
+
 import numpy as np
 from nems.modules.fir import _offset_coefficients, per_channel
+from scipy.signal import oaconvolve
 
 from modulebase import ModuleBase
+from modules._fir_kernels import offset_coefficients_f64
 from registry import register_module
 
 
 class FIRBase(ModuleBase):
     # because not passed to registry, only children who are in registry need to implement interface
-    def offset_coefficients(self, coefficients, offsets, fs, pad_bins):
+    def offset_coefficients(self, coefficients, offsets, fs, pad_bins=False):
+        if (not pad_bins and isinstance(coefficients, np.ndarray) and coefficients.dtype == np.float64
+                and coefficients.ndim == 2 and np.size(offsets) == coefficients.shape[0]):
+            offsets = np.ascontiguousarray(offsets, dtype=np.float64).ravel()
+            return offset_coefficients_f64(np.ascontiguousarray(coefficients), offsets, float(fs))
+
         return _offset_coefficients(coefficients, offsets, fs, pad_bins=pad_bins)
 
     def per_channel(self, signal, coefficients, bank_count=1, non_causal=False, rate=1, cross_channels=False):
+        if (bank_count == 1 and rate == 1 and not cross_channels and not non_causal
+                and signal.ndim == 2 and signal.shape[0] == coefficients.shape[0]):
+            # NEMS filters each channel with lfilter, seeded so the history before the first bin is
+            # x[0] repeated, then sums the channels of the bank. Padding with that history and
+            # keeping the 'valid' part gives the same filtering in one batched overlap-add call.
+            history = np.repeat(signal[:, :1], coefficients.shape[1] - 1, axis=1)
+            padded = np.concatenate((history, signal), axis=1)
+            filtered = oaconvolve(padded, coefficients, mode='valid', axes=-1)
+            return filtered.sum(axis=0, keepdims=True)
+
         return per_channel(signal, coefficients, bank_count, non_causal, rate, cross_channels)
 
 
@@ -21,15 +40,41 @@ class FIRBasic(FIRBase):
     kwarg_labels = ['fs', 'non_causal', 'offsets']
     kw = 'fir'
 
+    # max number of closures kept in the fn cache
+    fn_cache_size = 32
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._fn_cache = OrderedDict()
+
     def get_fn(self, phis, kwargs):
         coefficients = phis['coefficients']
         offsets = kwargs['offsets']
+        non_causal = kwargs['non_causal']
+
+        # Non-scalars (arrays, lists) are keyed by identity; the objects are kept in the entry so
+        # ids can't be recycled. Because of that, mutating coefficients or offsets in place is not
+        # seen by the cache: a closure built with nonzero offsets keeps the old offset coefficients.
+        offsets_key = offsets if np.isscalar(offsets) else id(offsets)
+        key = (id(coefficients), kwargs['fs'], non_causal, offsets_key)
 
-        if not np.all(offsets == 0):
+        entry = self._fn_cache.get(key)
+        if entry is not None and entry[0] is coefficients and entry[1] is offsets:
+            self._fn_cache.move_to_end(key)
+            return entry[2]
+
+        # scalar offsets (the common case) skip the elementwise compare, arrays stop at the first nonzero
+        offsets_are_zero = offsets == 0 if np.isscalar(offsets) else not np.any(offsets)
+        if not offsets_are_zero:
             coefficients = self.offset_coefficients(coefficients, offsets, kwargs['fs'])
 
         def fn(signal):
-            return self.per_channel(signal, coefficients, non_causal=kwargs['non_causal'], rate=1)
+            return self.per_channel(signal, coefficients, non_causal=non_causal, rate=1)
+
+        self._fn_cache[key] = (phis['coefficients'], offsets, fn)
+        if len(self._fn_cache) > self.fn_cache_size:
+            self._fn_cache.popitem(last=False)
 
         return fn
 
@@ -5,6 +5,17 @@ import numpy as np
 from modulebase import ModuleBase
 from registry import register_module, KeywordFormatError
 
+_KW_RE = re.compile(r'^(?P<inputs>\d+)x(?P<outputs>\d+)(?:x(?P<bank>\d+))?(?P<options>(?:\.[a-zA-Z])*)$')
+
+# options are single letters, so they are tracked as bits indexed from "A" (covers both cases)
+_AVAILABLE_OPTIONS = 'cgnzo'
+_ALLOWED_MASK = 0
+for _c in _AVAILABLE_OPTIONS:
+    _ALLOWED_MASK |= 1 << (ord(_c) - ord('A'))
+del _c
+_G_BIT = 1 << (ord('g') - ord('A'))
+_C_BIT = 1 << (ord('c') - ord('A'))
+
 
 @register_module(kw='wc')
 class WCBasic(ModuleBase):
@@ -13,39 +24,42 @@ class WCBasic(ModuleBase):
     kwarg_labels = None
 
     def get_fn(self, phis, kwargs):
+        # contiguous once up front, so every call hits the BLAS gemm fast path without a copy
+        coefficients = np.ascontiguousarray(phis['coefficients'])
 
         def fn(signal):
-            return phis['coefficients'] @ signal
+            return np.matmul(coefficients, signal)
 
         return fn
 
     def parse_kw(self, kw_string: str):
-        regex = r'^(?P<inputs>\d+)x(?P<outputs>\d+)(?:x(?P<bank>\d+))?(?P<options>(?:\.[a-zA-Z])*)$'
-        groups = re.match(regex, kw_string)
+        groups = _KW_RE.match(kw_string)
 
         if groups is None:
             raise KeywordFormatError(f'Unable to parse kw string "{kw_string}".')
         else:
             groups = groups.groupdict()
 
-        coeff_mean = np.empty((int(groups['inputs']), int(groups['outputs'])))
-        coeff_sd = np.empty((int(groups['inputs']), int(groups['outputs'])))
+        # one block for both stats, so they can be filled in a single pass
+        coeff_mean, coeff_sd = np.empty((2, int(groups['inputs']), int(groups['outputs'])))
 
         if groups['options']:
-            options = re.findall(r'([a-zA-Z])', groups['options'])
+            mask = 0
+            for ch in groups['options']:
+                if ch != '.':
+                    mask |= 1 << (ord(ch) - ord('A'))
 
-            available_options = {'c', 'g', 'n', 'z', 'o'}
-            if not available_options >= set(options):
+            if mask & ~_ALLOWED_MASK:
                 raise KeywordFormatError(f'Error in options specified. Specified: "{groups["options"]}".'
-                                         f' Available: "{available_options}".')
+                                         f' Available: "{set(_AVAILABLE_OPTIONS)}".')
 
-            if 'g' in options:
-                if 'c' in options:
+            if mask & _G_BIT:
+                if mask & _C_BIT:
                     raise KeywordFormatError(f'{str(self)} keyword cannot have both "g" and "c": {kw_string}"')
 
                 # make gaussian coefficients here
 
-            if 'c' in options:
+            if mask & _C_BIT:
                 # do 'c' stuff here
                 pass
 
@@ -1,13 +1,14 @@
 import importlib.util
 import logging
+import re
 from pathlib import Path
 
-from tabulate import tabulate
-
 from modulebase import ModuleBase
 
 logger = logging.getLogger(__name__)
 
+_IDENTIFIER_RE = re.compile(r'\b[A-Za-z_]\w*\b')
+
 
 class RegistryError(Exception):
     """Base exception for registry errors."""
@@ -38,12 +39,13 @@ class ModuleRegistry:
 
     Malformed modules will raise an error at instantiation in `activate()`.
     """
-    subclasses = []
+    # spec -> (module class, kw), so re-registering a class replaces its earlier entry
+    subclasses = {}
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.path_dict = {}
+        self.path_dict = _TableDict()
         self.kw_registry = KeywordRegistry()
 
     def __getitem__(self, item):
@@ -56,13 +58,19 @@ class ModuleRegistry:
         return item in self.path_dict
 
     def __str__(self):
-        """Print a pretty table instead of a dict"""
-        modules = self.path_dict.values()
-        pathspec = self.path_dict.keys()
+        """Print a pretty table instead of a dict. The table is cached until `path_dict` changes."""
+        if self.path_dict._str_cache is None:
+            # only needed for display, so kept off the import path
+            from tabulate import tabulate
+
+            modules = self.path_dict.values()
+            pathspec = self.path_dict.keys()
 
-        return tabulate({'Module Name': modules,
-                         'Pathspec': pathspec},
-                        headers='keys')
+            self.path_dict._str_cache = tabulate({'Module Name': modules,
+                                                  'Pathspec': pathspec},
+                                                 headers='keys')
+
+        return self.path_dict._str_cache
 
     @classmethod
     def register(cls, module_class, kw=None):
@@ -74,7 +82,7 @@ class ModuleRegistry:
         if not issubclass(module_class, ModuleBase):
             raise TypeError(f'Modules must inherit from "ModuleBase".')
 
-        cls.subclasses.append((module_class, kw))
+        cls.subclasses[module_class._spec] = (module_class, kw)
 
         if kw is not None:
             logger.info(f'Registered module "{module_class.name}" with keyword "{kw}".')
@@ -91,6 +99,9 @@ class ModuleRegistry:
         will not get registered. Prior to activating the registry, call this method on the
         directories containing the modules.
 
+        Each file is imported by its path, so subdirectories don't need to be packages and
+        `sys.path` is left untouched. The pathspecs are rooted at the directory name.
+
         :param directory: Directory of python files to import. Ignores "__init__.py".
         """
         directory = Path(directory)
@@ -99,8 +110,8 @@ class ModuleRegistry:
 
         for module in directory.glob('**/*.py'):
             if module.name != '__init__.py':
-                spec_root = str(module.relative_to(directory.parent).with_suffix('')).replace('/', '.')
-                ModuleRegistry.load_module(module, spec_root)
+                spec_root = '.'.join(module.relative_to(directory.parent).with_suffix('').parts)
+                _exec_file(module, spec_root)
 
     @classmethod
     def load_module(cls, module, spec_root=None):
@@ -115,16 +126,18 @@ class ModuleRegistry:
         and is instead just set to the module name. This can result in conflicts in the registry
         if two modules have the same name and pathspec.
 
-        :param file: File to import.
+        The file is always executed from its path (the loader still uses the bytecode cache), so
+        modules of the same name elsewhere on `sys.path` can't stand in for it.
+
+        :param module: File to import.
+        :param spec_root: Dotted module name for the file. Defaults to the file name.
         """
         file = Path(module)
 
         if spec_root is None:
             spec_root = file.stem
 
-        spec = importlib.util.spec_from_file_location(spec_root, module)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        _exec_file(file, spec_root)
 
     def activate(self):
         """Instantiates and adds subclasses to registries.
@@ -132,7 +145,7 @@ class ModuleRegistry:
         Populates two dictionaries where the values are module subclasses. In `kw_registry`, the
         keys are the optionally specified keywords. In `path_dict`, the keys are the spec strings.
         """
-        for cls, kw in ModuleRegistry.subclasses:
+        for cls, kw in ModuleRegistry.subclasses.values():
             module_instance = cls()
             self.path_dict[module_instance.spec] = module_instance
             logger.info(f'Activated module "{module_instance.spec}".')
@@ -151,6 +164,45 @@ class ModuleRegistry:
 
         return self
 
+    def compile_pipeline(self, steps):
+        """Builds a single function applying a sequence of modules, for use with `Signal.transform()`.
+
+        Runs of consecutive modules that provide a `get_expr` method (elementwise modules) are
+        fused into numexpr evaluations, so the signal is read and written once for the whole
+        run instead of once per module. A module whose expression uses the signal more than
+        once starts a new evaluation rather than being inlined. Other modules are applied with
+        their usual function. If any module in a fused run has a true `low_precision` kwarg,
+        float64 input to the run is downcast and computed in float32.
+
+        :param steps: Sequence of `(module, phis, kwargs)`. Modules are instances or pathspecs.
+        :return: Function of the signal data.
+        """
+        stages = []
+        run = []
+        for module, phis, kwargs in steps:
+            if isinstance(module, str):
+                module = self[module]
+            module.check_phis_kwargs(phis=phis, kwargs=kwargs)
+
+            if hasattr(module, 'get_expr'):
+                run.append((module, phis, kwargs))
+                continue
+
+            if run:
+                stages.append(_fuse_expressions(run))
+                run = []
+            stages.append(module.get_fn(phis=phis, kwargs=kwargs))
+
+        if run:
+            stages.append(_fuse_expressions(run))
+
+        def fn(signal):
+            for stage in stages:
+                signal = stage(signal)
+            return signal
+
+        return fn
+
     def get_by_path(self, key, default=None):
         """Get item from `path_dict`. If default is specified, uses `dict.get`.
 
@@ -176,7 +228,44 @@ class ModuleRegistry:
         return self.kw_registry[key]
 
 
-class KeywordRegistry(dict):
+class _TableDict(dict):
+    """Dict whose rendered table (`_str_cache`) is dropped by every mutation."""
+    _str_cache = None
+
+    def __setitem__(self, key, value):
+        self._str_cache = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._str_cache = None
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._str_cache = None
+        return super().__ior__(other)
+
+    def update(self, *args, **kwargs):
+        self._str_cache = None
+        super().update(*args, **kwargs)
+
+    def pop(self, *args):
+        self._str_cache = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._str_cache = None
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._str_cache = None
+        return super().setdefault(key, default)
+
+    def clear(self):
+        self._str_cache = None
+        super().clear()
+
+
+class KeywordRegistry(_TableDict):
     """Registry of keywords. Subclasses dict to override getter and str."""
     def __getitem__(self, item):
         """Raise KeywordMissingError instead."""
@@ -186,13 +275,81 @@ class KeywordRegistry(dict):
         return super().__getitem__(item)
 
     def __str__(self):
-        """Print a pretty table instead of a dict."""
-        modules = self.values()
-        keywords = self.keys()
+        """Print a pretty table instead of a dict. The table is cached until the dict changes."""
+        if self._str_cache is None:
+            # only needed for display, so kept off the import path
+            from tabulate import tabulate
 
-        return tabulate({'Module Name': modules,
-                         'Keyword': keywords},
-                        headers='keys')
+            modules = self.values()
+            keywords = self.keys()
+
+            self._str_cache = tabulate({'Module Name': modules,
+                                        'Keyword': keywords},
+                                       headers='keys')
+
+        return self._str_cache
+
+
+def _exec_file(file, name):
+    """Executes a .py file as a module called `name`, without going through `sys.path`."""
+    spec = importlib.util.spec_from_file_location(name, file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+
+def _fuse_expressions(run):
+    """Numexpr function for a run of `(module, phis, kwargs)` with `get_expr` methods.
+
+    A stage whose expression uses `signal` once is inlined into the previous expression, with
+    its locals prefixed per stage so they can't collide. A stage that uses `signal` more than
+    once would recompute the inlined stages for every use, so the expression so far is
+    evaluated first instead. Expressions are built once per input dtype.
+    """
+    # numeric backends are only needed once a pipeline is compiled, not to import the registry
+    import numexpr as ne
+    import numpy as np
+
+    compiled = {}
+    low_precision = any(kwargs is not None and kwargs.get('low_precision') for _, _, kwargs in run)
+
+    def build(dtype):
+        segments = []
+        expr = 'signal'
+        local_dict = {}
+        segment_dtype = dtype
+        for i, (module, phis, kwargs) in enumerate(run):
+            stage_expr, stage_locals = module.get_expr(phis, kwargs, dtype)
+            if expr != 'signal' and _IDENTIFIER_RE.findall(stage_expr).count('signal') > 1:
+                segments.append((expr, local_dict))
+                expr = 'signal'
+                local_dict = {}
+                segment_dtype = dtype
+
+            names = {name: f's{i}_{name}' for name in stage_locals}
+            names['signal'] = f'({expr})'
+
+            expr = _IDENTIFIER_RE.sub(lambda m: names.get(m.group(0), m.group(0)), stage_expr)
+            local_dict.update({names[name]: value for name, value in stage_locals.items()})
+
+            # the next stage is built for the dtype numexpr actually gives, found on a one-element probe
+            probe = np.zeros(1, dtype=segment_dtype)
+            dtype = ne.evaluate(expr, local_dict={**local_dict, 'signal': probe}).dtype
+
+        segments.append((expr, local_dict))
+        return segments
+
+    def fn(signal):
+        if low_precision and signal.dtype == np.float64:
+            signal = signal.astype(np.float32)
+
+        if signal.dtype not in compiled:
+            compiled[signal.dtype] = build(signal.dtype)
+
+        for expr, local_dict in compiled[signal.dtype]:
+            signal = ne.evaluate(expr, local_dict={**local_dict, 'signal': signal})
+        return signal
+
+    return fn
 
 
 def register_module(kw=None):
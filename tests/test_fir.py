@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from modules._fir_kernels import offset_coefficients_f64
+from registry import ModuleRegistry
+
+
+@pytest.fixture
+def nems_fir():
+    return pytest.importorskip('nems.modules.fir')
+
+
+@pytest.fixture
+def fir(nems_fir):
+    import modules.fir  # noqa: F401 (registers the FIR modules)
+    return ModuleRegistry.subclasses['modules.fir.FIRBasic'][0]()
+
+
+@pytest.mark.parametrize('shape, n_taps', [((10, 600), 3), ((10, 600), 15), ((4, 40), 60), ((3, 50), 1)])
+def test_per_channel_fast_path_matches_nems(fir, nems_fir, shape, n_taps):
+    rng = np.random.default_rng(0)
+    # offset from zero so the x[0] history NEMS filters with matters
+    signal = rng.standard_normal(shape) + 5
+    coefficients = rng.standard_normal((shape[0], n_taps))
+
+    expected = nems_fir.per_channel(signal, coefficients, 1, 0, 1, False)
+    actual = fir.per_channel(signal, coefficients)
+
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual, expected, atol=1e-9)
+
+
+def test_fir_basic_matches_nems_on_demo_input(fir, nems_fir):
+    rng = np.random.default_rng(0)
+    signal = rng.integers(0, 100, size=(10, 600))
+    coefficients = np.array(range(30)).reshape((10, 3))
+
+    fn = fir.get_fn(phis={'coefficients': coefficients}, kwargs={'fs': 60, 'non_causal': False, 'offsets': 0})
+
+    np.testing.assert_allclose(fn(signal), nems_fir.per_channel(signal, coefficients, 1, 0, 1, False))
+
+
+def test_offset_kernel_matches_interp():
+    rng = np.random.default_rng(0)
+    coefficients = rng.standard_normal((10, 15))
+    offsets = rng.uniform(-0.1, 0.1, size=10)
+    fs = 60.0
+
+    t = np.arange(coefficients.shape[1])
+    expected = np.array([np.interp(t - offset * fs, t, c, left=0, right=0)
+                         for c, offset in zip(coefficients, offsets)])
+
+    np.testing.assert_allclose(offset_coefficients_f64(coefficients, offsets, fs), expected)
+
+
+def test_offset_coefficients_match_nems(fir, nems_fir):
+    rng = np.random.default_rng(0)
+    coefficients = rng.standard_normal((10, 15))
+    offsets = rng.uniform(-0.05, 0.05, size=(10, 1))
+
+    np.testing.assert_allclose(fir.offset_coefficients(coefficients, offsets, 60),
+                               nems_fir._offset_coefficients(coefficients, offsets, 60))
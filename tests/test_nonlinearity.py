@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+import modules.nonlinearity  # noqa: F401 (registers the Sigmoid module)
+from registry import ModuleRegistry
+
+PHIS = {'base': 0.5, 'amplitude': 2, 'shift': 0.25, 'kappa': 1.5}
+
+
+def expected_sigmoid(signal):
+    return PHIS['base'] + 0.5 * PHIS['amplitude'] * (1 + np.tanh(PHIS['kappa'] * (signal - PHIS['shift'])))
+
+
+@pytest.fixture(params=['numexpr', 'numba'])
+def sigmoid(request):
+    module = ModuleRegistry.subclasses['modules.nonlinearity.Sigmoid'][0]()
+    module.backend = request.param
+    return module
+
+
+@pytest.mark.parametrize('dtype, kwargs, out_dtype', [
+    (np.float32, None, np.float32),
+    (np.float64, None, np.float64),
+    (np.int64, None, np.float64),
+    (np.float32, {'low_precision': True}, np.float32),
+    (np.float64, {'low_precision': True}, np.float32),
+    (np.float64, {'low_precision': False}, np.float64),
+])
+def test_sigmoid_dtype(sigmoid, dtype, kwargs, out_dtype):
+    signal = (np.random.default_rng(0).standard_normal((10, 600)) * 3).astype(dtype)
+
+    out = sigmoid(phis=PHIS, kwargs=kwargs)(signal)
+
+    assert out.dtype == out_dtype
+    np.testing.assert_allclose(out, expected_sigmoid(signal.astype(np.float64)),
+                               rtol=1e-5 if out_dtype == np.float32 else 1e-12)
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+import modules.nonlinearity  # noqa: F401 (registers the Sigmoid module)
+from registry import ModuleRegistry
+
+PHIS = {'base': 0.5, 'amplitude': 2, 'shift': 0.25, 'kappa': 1.5}
+
+
+@pytest.fixture
+def sigmoid():
+    return ModuleRegistry.subclasses['modules.nonlinearity.Sigmoid'][0]()
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64, np.int64])
+def test_fused_pipeline_matches_sequential(sigmoid, dtype):
+    signal = (np.random.default_rng(0).standard_normal((10, 600)) * 10).astype(dtype)
+    steps = [(sigmoid, PHIS, None), (sigmoid, PHIS, None)]
+
+    out = ModuleRegistry().compile_pipeline(steps)(signal)
+
+    expected = signal
+    for module, phis, kwargs in steps:
+        expected = module(phis=phis, kwargs=kwargs)(expected)
+
+    assert out.dtype == expected.dtype
+    np.testing.assert_allclose(out, expected, rtol=1e-6)
+
+
+def test_low_precision_pipeline_computes_in_float32(sigmoid):
+    signal = np.random.default_rng(0).standard_normal((10, 600))
+    steps = [(sigmoid, PHIS, {'low_precision': True}), (sigmoid, PHIS, None)]
+
+    out = ModuleRegistry().compile_pipeline(steps)(signal)
+
+    assert out.dtype == np.float32